@@ -5,24 +5,57 @@ Implements Multilevel Queue scheduling with:
 - Queue 2: FCFS (User Processes)
 """
 
+import heapq
+from collections import deque
+from operator import attrgetter
+
+# NumPy is optional: when available, final metrics are computed as
+# vectorized array operations instead of one Python call per process
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 class MLQScheduler:
     """
     Multilevel Queue Scheduler with static priority
     """
     
-    def __init__(self, processes):
+    def __init__(self, processes, debug=False):
         """
         Initialize the MLQ scheduler
         
         Args:
             processes: List of Process objects
+            debug: If True, print per-event trace output. Off by default
+                   so the simulation is not bound by stdout I/O
         """
         self.processes = processes
         self.current_time = 0
-        
+        self.debug = debug
+
+        # Arrival index: processes sorted by arrival time plus a cursor.
+        # Each tick we only look at the cursor position instead of scanning
+        # the whole process list (O(1) amortized per arrival instead of O(N) per tick)
+        self._arrivals_sorted = sorted(processes, key=attrgetter('arrival_time'))
+        self._arrival_idx = 0
+
         # Two queues: Queue 1 (System - Priority 1-2), Queue 2 (User - Priority 3-5)
-        self.queue1 = []  # System processes - Preemptive Priority
-        self.queue2 = []  # User processes - FCFS
+        # Queue 1 is a binary heap of (priority, arrival_time, seq, process)
+        # tuples so the highest priority process is always queue1[0] without
+        # re-sorting. The seq counter breaks ties in insertion order.
+        # Queue 2 is a deque so FCFS removal from the front is O(1).
+        self.queue1 = []            # System processes - Preemptive Priority (heap)
+        self.queue2 = deque()       # User processes - FCFS
+        self._seq = 0               # Tie-breaker for heap entries
+        
+        # Static queue membership by PID, partitioned in a single pass.
+        # Kept for diagnostics so later queries don't rescan the process list
+        self._q1_pids = []
+        self._q2_pids = []
+        for p in processes:
+            (self._q1_pids if p.queue == 1 else self._q2_pids).append(p.pid)
         
         # Currently executing process
         self.current_process = None
@@ -33,117 +66,105 @@ class MLQScheduler:
         # Completed processes
         self.completed_processes = []
         
-        print("[DEBUG] MLQ Scheduler initialized")
-        print(f"[DEBUG] Total processes to schedule: {len(processes)}")
-        self._print_initial_assignments()
+        # Safety bound for the main loop (sum of all burst times + max
+        # arrival time), computed once instead of at the top of run()
+        if processes:
+            self._max_time = (sum(p.burst_time for p in processes) +
+                              max(p.arrival_time for p in processes) + 10)
+        else:
+            self._max_time = 0
+        
+        self._dbg("[DEBUG] MLQ Scheduler initialized")
+        self._dbg("[DEBUG] Total processes to schedule: %d", len(processes))
+        if self.debug:
+            self._print_initial_assignments()
+    
+    def _dbg(self, msg, *args):
+        """
+        Print a debug message only when debugging is enabled
+        Uses %-style arguments so the message is only formatted
+        when it will actually be printed
+        """
+        if self.debug:
+            print(msg % args if args else msg)
     
     def _print_initial_assignments(self):
         """
         Print initial queue assignments for all processes
         """
         print("\n[DEBUG] Initial Queue Assignments:")
-        queue1_procs = [p.pid for p in self.processes if p.queue == 1]
-        queue2_procs = [p.pid for p in self.processes if p.queue == 2]
-        print(f"  Queue 1 (System - Preemptive Priority): {queue1_procs}")
-        print(f"  Queue 2 (User - FCFS): {queue2_procs}")
+        print(f"  Queue 1 (System - Preemptive Priority): {self._q1_pids}")
+        print(f"  Queue 2 (User - FCFS): {self._q2_pids}")
         print()
     
     def add_arriving_processes(self):
         """
-        Check for processes arriving at current_time and add to appropriate queues
+        Add all processes that have arrived by current_time to their queues
+        Advances the arrival cursor, so calling this twice at the same
+        time is harmless (already-added processes are never re-added)
         """
-        arriving = [p for p in self.processes 
-                   if p.arrival_time == self.current_time and not p.is_completed]
-        
-        for process in arriving:
+        while (self._arrival_idx < len(self._arrivals_sorted) and
+               self._arrivals_sorted[self._arrival_idx].arrival_time <= self.current_time):
+            process = self._arrivals_sorted[self._arrival_idx]
+            self._arrival_idx += 1
+
             if process.queue == 1:
-                self.queue1.append(process)
-                print(f"[DEBUG] Time {self.current_time}: {process.pid} arrived → Queue 1")
+                heapq.heappush(self.queue1,
+                               (process.priority, process.arrival_time, self._seq, process))
+                self._seq += 1
+                self._dbg("[DEBUG] Time %d: %s arrived → Queue 1", self.current_time, process.pid)
             else:
                 self.queue2.append(process)
-                print(f"[DEBUG] Time {self.current_time}: {process.pid} arrived → Queue 2")
+                self._dbg("[DEBUG] Time %d: %s arrived → Queue 2", self.current_time, process.pid)
     
-    def sort_queue1_by_priority(self):
+    def _next_arrival_time(self):
         """
-        Sort Queue 1 by priority (lower number = higher priority)
-        This is needed for Preemptive Priority scheduling
+        Return the arrival time of the next not-yet-queued process,
+        or infinity if every process has already arrived
         """
-        self.queue1.sort(key=lambda p: (p.priority, p.arrival_time))
+        if self._arrival_idx < len(self._arrivals_sorted):
+            return self._arrivals_sorted[self._arrival_idx].arrival_time
+        return float('inf')
     
-    def get_next_process(self):
+    def _log_execution(self, pid, start, end):
         """
-        Get the next process to execute based on MLQ rules:
-        1. Queue 1 (System) has absolute priority over Queue 2 (User)
-        2. Queue 1 uses Preemptive Priority (lowest priority number first)
-        3. Queue 2 uses FCFS (first arrival first)
-        
-        Returns:
-            Process object to execute, or None if no process available
+        Record a burst in the execution log for the Gantt chart
+        Consecutive bursts of the same process are merged on append, so
+        the log holds one entry per scheduling event rather than one per
+        time unit
         """
-        # Always check Queue 1 first (static priority)
-        if self.queue1:
-            # Queue 1: Preemptive Priority - get highest priority process
-            self.sort_queue1_by_priority()
-            return self.queue1[0]
-        
-        # If Queue 1 is empty, check Queue 2
-        elif self.queue2:
-            # Queue 2: FCFS - get first process in queue
-            return self.queue2[0]
-        
-        # No process available
-        return None
+        log = self.execution_log
+        if log and log[-1][0] == pid and log[-1][2] == start:
+            log[-1] = (pid, log[-1][1], end)
+        else:
+            log.append((pid, start, end))
     
     def remove_from_queue(self, process):
         """
-        Remove a process from its queue
+        Remove a process from the front of its queue
+        The scheduler only ever removes the process it just executed,
+        which is the heap head (Queue 1) or the FCFS front (Queue 2),
+        so removal is O(1)/O(log k) with no membership scan
         
         Args:
             process: Process object to remove
         """
-        if process in self.queue1:
-            self.queue1.remove(process)
-            print(f"[DEBUG] Time {self.current_time}: {process.pid} removed from Queue 1")
-        elif process in self.queue2:
-            self.queue2.remove(process)
-            print(f"[DEBUG] Time {self.current_time}: {process.pid} removed from Queue 2")
-    
-    def check_preemption(self):
-        """
-        Check if current process should be preempted
-        Used for Queue 1 (Preemptive Priority) and Queue 2 (when Queue 1 arrives)
-        
-        Returns:
-            True if preemption should occur, False otherwise
-        """
-        if self.current_process is None:
-            return False
-        
-        # If Queue 1 has a process and current is from Queue 2
-        # Queue 2 must be preempted (static priority)
-        if self.queue1 and self.current_process.queue == 2:
-            print(f"[DEBUG] Time {self.current_time}: {self.current_process.pid} "
-                  f"preempted by Queue 1 process")
-            return True
-        
-        # If current process is in Queue 1, check for higher priority arrival
-        if self.current_process.queue == 1 and self.queue1:
-            self.sort_queue1_by_priority()
-            highest_priority = self.queue1[0]
-            
-            # Preempt if a higher priority process is waiting
-            if highest_priority.priority < self.current_process.priority:
-                print(f"[DEBUG] Time {self.current_time}: {self.current_process.pid} "
-                      f"preempted by higher priority {highest_priority.pid}")
-                return True
-        
-        return False
+        if process.queue == 1:
+            assert self.queue1[0][3] is process, "Queue 1 head mismatch on removal"
+            heapq.heappop(self.queue1)
+            self._dbg("[DEBUG] Time %d: %s removed from Queue 1", self.current_time, process.pid)
+        else:
+            assert self.queue2[0] is process, "Queue 2 front mismatch on removal"
+            self.queue2.popleft()
+            self._dbg("[DEBUG] Time %d: %s removed from Queue 2", self.current_time, process.pid)
     
     def print_queue_status(self):
         """
         Print current status of both queues (for debugging)
         """
-        q1_status = [p.pid for p in self.queue1]
+        if not self.debug:
+            return
+        q1_status = [entry[3].pid for entry in self.queue1]
         q2_status = [p.pid for p in self.queue2]
         current = self.current_process.pid if self.current_process else "None"
         
@@ -153,7 +174,8 @@ class MLQScheduler:
     def execute_queue1_process(self, process):
         """
         Execute a Queue 1 (System) process with Preemptive Priority logic
-        Executes for 1 time unit, then checks for preemption
+        Runs until the process completes or the next arrival, whichever
+        comes first
         
         Args:
             process: Process object from Queue 1
@@ -164,23 +186,30 @@ class MLQScheduler:
         # Set start time if this is first execution
         if process.start_time is None:
             process.start_time = self.current_time
-            print(f"[DEBUG] Time {self.current_time}: {process.pid} gets CPU for first time (RT will be {self.current_time - process.arrival_time})")
+            self._dbg("[DEBUG] Time %d: %s gets CPU for first time (RT will be %d)",
+                      self.current_time, process.pid, self.current_time - process.arrival_time)
         
-        # Execute for 1 time unit
+        # Execute until the process finishes or the next arrival, whichever
+        # comes first. Nothing already queued can preempt mid-burst, so the
+        # next arrival is the only event that can change the schedule.
         execution_start = self.current_time
-        process.execute(1)
-        self.current_time += 1
+        run_for = min(process.remaining_time,
+                      max(1, self._next_arrival_time() - self.current_time))
+        process.remaining_time -= run_for
+        self.current_time += run_for
         
         # Log execution for Gantt chart
-        self.execution_log.append((process.pid, execution_start, self.current_time))
-        print(f"[DEBUG] Time {execution_start}-{self.current_time}: {process.pid} executing (Remaining: {process.remaining_time})")
+        self._log_execution(process.pid, execution_start, self.current_time)
+        self._dbg("[DEBUG] Time %d-%d: %s executing (Remaining: %d)",
+                  execution_start, self.current_time, process.pid, process.remaining_time)
         
         # Check if process completed
         if process.is_completed:
             process.completion_time = self.current_time
             self.remove_from_queue(process)
             self.completed_processes.append(process)
-            print(f"[DEBUG] Time {self.current_time}: {process.pid} COMPLETED (CT={process.completion_time})")
+            self._dbg("[DEBUG] Time %d: %s COMPLETED (CT=%d)",
+                      self.current_time, process.pid, process.completion_time)
             return True
         
         return False
@@ -188,54 +217,38 @@ class MLQScheduler:
     def handle_queue1_scheduling(self):
         """
         Handle Queue 1 (Preemptive Priority) scheduling logic
-        This method manages:
-        1. Adding new arrivals to Queue 1
-        2. Checking for preemption
-        3. Executing highest priority process
+        Assumes run() has already added the current tick's arrivals
+        
+        Preemption needs no explicit bookkeeping: bursts stop at the next
+        arrival, every waiting Queue 1 process sits in the heap, and this
+        method simply takes the heap head at each decision point. A
+        preempted Queue 2 process stays at the front of its deque (it is
+        only removed on completion), so FCFS order is preserved
         
         Returns:
             True if a process was executed, False if Queue 1 is empty
         """
-        # Add any arriving processes
-        self.add_arriving_processes()
-        
         # If no processes in Queue 1, return False
         if not self.queue1:
             return False
         
-        # Check if current process should be preempted
-        if self.current_process and self.check_preemption():
-            # Put current process back in its queue if not completed
-            if not self.current_process.is_completed:
-                if self.current_process.queue == 1:
-                    # Already in queue1, just reset current_process
-                    pass
-                else:
-                    # Queue 2 process being preempted, put back in queue2
-                    if self.current_process not in self.queue2:
-                        self.queue2.insert(0, self.current_process)  # Put back at front (FCFS preservation)
-            self.current_process = None
+        # Highest priority process is the heap head
+        next_process = self.queue1[0][3]
+        self.current_process = next_process
         
-        # Get highest priority process from Queue 1
-        next_process = self.get_next_process()
+        # Execute until completion or the next arrival
+        completed = self.execute_queue1_process(next_process)
         
-        if next_process and next_process.queue == 1:
-            self.current_process = next_process
-            
-            # Execute the process for 1 time unit
-            completed = self.execute_queue1_process(next_process)
-            
-            if completed:
-                self.current_process = None
-            
-            return True
+        if completed:
+            self.current_process = None
         
-        return False
+        return True
     
     def execute_queue2_process(self, process):
         """
         Execute a Queue 2 (User) process with FCFS logic
-        Executes for 1 time unit, but can be preempted by Queue 1 arrivals
+        Runs until the process completes or the next arrival (any Queue 1
+        arrival preempts Queue 2, so bursts never cross an arrival)
         
         Args:
             process: Process object from Queue 2
@@ -246,23 +259,30 @@ class MLQScheduler:
         # Set start time if this is first execution
         if process.start_time is None:
             process.start_time = self.current_time
-            print(f"[DEBUG] Time {self.current_time}: {process.pid} gets CPU for first time (RT will be {self.current_time - process.arrival_time})")
+            self._dbg("[DEBUG] Time %d: %s gets CPU for first time (RT will be %d)",
+                      self.current_time, process.pid, self.current_time - process.arrival_time)
         
-        # Execute for 1 time unit
+        # Execute until the process finishes or the next arrival, whichever
+        # comes first. Nothing already queued can preempt mid-burst, so the
+        # next arrival is the only event that can change the schedule.
         execution_start = self.current_time
-        process.execute(1)
-        self.current_time += 1
+        run_for = min(process.remaining_time,
+                      max(1, self._next_arrival_time() - self.current_time))
+        process.remaining_time -= run_for
+        self.current_time += run_for
         
         # Log execution for Gantt chart
-        self.execution_log.append((process.pid, execution_start, self.current_time))
-        print(f"[DEBUG] Time {execution_start}-{self.current_time}: {process.pid} executing (Remaining: {process.remaining_time})")
+        self._log_execution(process.pid, execution_start, self.current_time)
+        self._dbg("[DEBUG] Time %d-%d: %s executing (Remaining: %d)",
+                  execution_start, self.current_time, process.pid, process.remaining_time)
         
         # Check if process completed
         if process.is_completed:
             process.completion_time = self.current_time
             self.remove_from_queue(process)
             self.completed_processes.append(process)
-            print(f"[DEBUG] Time {self.current_time}: {process.pid} COMPLETED (CT={process.completion_time})")
+            self._dbg("[DEBUG] Time %d: %s COMPLETED (CT=%d)",
+                      self.current_time, process.pid, process.completion_time)
             return True
         
         return False
@@ -271,6 +291,7 @@ class MLQScheduler:
         """
         Handle Queue 2 (FCFS) scheduling logic
         Queue 2 only executes when Queue 1 is empty
+        Assumes run() has already added the current tick's arrivals
         This method manages:
         1. Checking Queue 1 is empty (static priority rule)
         2. Executing first process in Queue 2 (FCFS order)
@@ -279,12 +300,9 @@ class MLQScheduler:
         Returns:
             True if a process was executed, False if Queue 2 is empty or Queue 1 has processes
         """
-        # Add any arriving processes
-        self.add_arriving_processes()
-        
         # CRITICAL: Queue 2 can only run if Queue 1 is empty (static priority)
         if self.queue1:
-            print(f"[DEBUG] Time {self.current_time}: Queue 2 blocked - Queue 1 has processes")
+            self._dbg("[DEBUG] Time %d: Queue 2 blocked - Queue 1 has processes", self.current_time)
             return False
         
         # If no processes in Queue 2, return False
@@ -295,9 +313,10 @@ class MLQScheduler:
         next_process = self.queue2[0]
         self.current_process = next_process
         
-        print(f"[DEBUG] Time {self.current_time}: Executing {next_process.pid} from Queue 2 (FCFS)")
+        self._dbg("[DEBUG] Time %d: Executing %s from Queue 2 (FCFS)",
+                  self.current_time, next_process.pid)
         
-        # Execute the process for 1 time unit
+        # Execute until completion or the next arrival
         completed = self.execute_queue2_process(next_process)
         
         if completed:
@@ -317,20 +336,15 @@ class MLQScheduler:
         print("STARTING MLQ SCHEDULING SIMULATION")
         print("="*60 + "\n")
         
-        # Calculate maximum possible time (sum of all burst times + max arrival time)
-        max_time = sum(p.burst_time for p in self.processes) + max(p.arrival_time for p in self.processes) + 10
-        
         # Main scheduling loop
         while len(self.completed_processes) < len(self.processes):
             
             # Safety check to prevent infinite loop
-            if self.current_time > max_time:
-                print(f"[ERROR] Exceeded maximum time ({max_time}). Breaking loop.")
+            if self.current_time > self._max_time:
+                print(f"[ERROR] Exceeded maximum time ({self._max_time}). Breaking loop.")
                 break
             
-            print(f"\n{'='*50}")
-            print(f"TIME: {self.current_time}")
-            print(f"{'='*50}")
+            self._dbg("\n%s\nTIME: %d\n%s", '='*50, self.current_time, '='*50)
             
             # Add arriving processes at current time
             self.add_arriving_processes()
@@ -344,29 +358,27 @@ class MLQScheduler:
             # STEP 1: Try to execute Queue 1 (System - Preemptive Priority)
             # Queue 1 has absolute priority over Queue 2
             if self.queue1:
-                print(f"[DECISION] Queue 1 has processes - executing Queue 1")
+                self._dbg("[DECISION] Queue 1 has processes - executing Queue 1")
                 process_executed = self.handle_queue1_scheduling()
             
             # STEP 2: If Queue 1 is empty, try Queue 2 (User - FCFS)
             elif self.queue2:
-                print(f"[DECISION] Queue 1 empty - executing Queue 2")
+                self._dbg("[DECISION] Queue 1 empty - executing Queue 2")
                 process_executed = self.handle_queue2_scheduling()
             
             # STEP 3: If no process executed (CPU idle)
             if not process_executed:
-                # Check if we're waiting for processes to arrive
-                waiting_processes = [p for p in self.processes if not p.is_completed]
-                
-                if waiting_processes:
-                    # Find next arrival time
-                    next_arrival = min(p.arrival_time for p in waiting_processes if p.arrival_time > self.current_time)
-                    print(f"[IDLE] CPU idle - waiting for next arrival at time {next_arrival}")
+                # The arrival cursor knows the next arrival directly -
+                # no need to scan for uncompleted processes
+                if self._arrival_idx < len(self._arrivals_sorted):
+                    next_arrival = self._arrivals_sorted[self._arrival_idx].arrival_time
+                    self._dbg("[IDLE] CPU idle - waiting for next arrival at time %d", next_arrival)
                     
                     # Jump to next arrival time
                     self.current_time = next_arrival
                 else:
                     # All processes completed
-                    print(f"[COMPLETE] All processes finished!")
+                    self._dbg("[COMPLETE] All processes finished!")
                     break
         
         print("\n" + "="*60)
@@ -375,7 +387,36 @@ class MLQScheduler:
         
         # Calculate metrics for all completed processes
         print("[CALCULATING METRICS]")
-        for process in self.completed_processes:
-            process.calculate_metrics()
+        self._calculate_all_metrics()
         
-        return self.completed_processes
\ No newline at end of file
+        return self.completed_processes
+    
+    def _calculate_all_metrics(self):
+        """
+        Fill in turnaround/waiting/response time for every completed process
+        With NumPy available this is done on parallel arrays (one C-level
+        pass per metric) instead of one Python method call per process
+        """
+        completed = self.completed_processes
+        
+        if np is None:
+            for process in completed:
+                process.calculate_metrics()
+            return
+        
+        n = len(completed)
+        ct = np.fromiter((p.completion_time for p in completed), dtype=np.int64, count=n)
+        at = np.fromiter((p.arrival_time for p in completed), dtype=np.int64, count=n)
+        bt = np.fromiter((p.burst_time for p in completed), dtype=np.int64, count=n)
+        st = np.fromiter((p.start_time for p in completed), dtype=np.int64, count=n)
+        
+        # TAT = CT - AT, WT = TAT - BT, RT = first CPU time - AT
+        tats = ct - at
+        wts = tats - bt
+        rts = st - at
+        
+        # Scatter the results back onto the Process objects
+        for process, tat, wt, rt in zip(completed, tats, wts, rts):
+            process.turnaround_time = int(tat)
+            process.waiting_time = int(wt)
+            process.response_time = int(rt)
\ No newline at end of file
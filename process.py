@@ -3,72 +3,61 @@ Process Class Definition
 Represents a single process with all its attributes and metrics
 """
 
+from dataclasses import dataclass, field
+
+# NumPy is optional; it backs the ProcessTable structure-of-arrays view
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@dataclass(slots=True, repr=False)
 class Process:
     """
     Process class to store process information and calculate metrics
+    Declared with slots so instances carry a fixed field layout instead
+    of a per-instance dict: smaller objects and faster attribute access
+    in the scheduler's hot path
+
+    Fields:
+        pid: Process ID (e.g., "P1", "P2")
+        arrival_time: When the process arrives in the ready queue
+        burst_time: Total CPU time required
+        priority: Priority level (1 = highest priority)
     """
-    
-    def __init__(self, pid, arrival_time, burst_time, priority):
-        """
-        Initialize a process with basic attributes
-        
-        Args:
-            pid: Process ID (e.g., "P1", "P2")
-            arrival_time: When the process arrives in the ready queue
-            burst_time: Total CPU time required
-            priority: Priority level (1 = highest priority)
-        """
-        # Basic process attributes
-        self.pid = pid
-        self.arrival_time = arrival_time
-        self.burst_time = burst_time
-        self.priority = priority
-        
-        # Queue assignment (will be set by scheduler)
-        # Priority 1-2 = System (Queue 1), Priority 3-5 = User (Queue 2)
-        self.queue = 1 if priority <= 2 else 2
-        
-        # Execution tracking
-        self.remaining_time = burst_time  # Time left to execute
-        self.start_time = None            # When process first gets CPU
-        self.completion_time = None       # When process finishes
-        self.is_completed = False         # Completion status
-        
-        # Metrics (calculated after execution)
-        self.turnaround_time = 0  # TAT = CT - AT
-        self.waiting_time = 0     # WT = TAT - BT
-        self.response_time = 0    # RT = First CPU time - AT
-        
-        print(f"[DEBUG] Created {self.pid}: AT={arrival_time}, BT={burst_time}, "
-              f"Priority={priority}, Queue={self.queue}")
-    
-    def execute(self, time_units=1):
+
+    pid: str
+    arrival_time: int
+    burst_time: int
+    priority: int
+
+    # Queue assignment (derived in __post_init__)
+    # Priority 1-2 = System (Queue 1), Priority 3-5 = User (Queue 2)
+    queue: int = field(init=False)
+
+    # Execution tracking
+    remaining_time: int = field(init=False)  # Time left to execute
+    start_time: int | None = None            # When process first gets CPU
+    completion_time: int | None = None       # When process finishes
+
+    # Metrics (calculated after execution)
+    turnaround_time: int = 0  # TAT = CT - AT
+    waiting_time: int = 0     # WT = TAT - BT
+    response_time: int = 0    # RT = First CPU time - AT
+
+    def __post_init__(self):
+        self.queue = 1 if self.priority <= 2 else 2
+        self.remaining_time = self.burst_time
+
+    @property
+    def is_completed(self):
         """
-        Execute the process for given time units
-        
-        Args:
-            time_units: Number of time units to execute (default 1)
-        
-        Returns:
-            Time units actually executed
+        Whether the process has finished executing
+        Derived from remaining_time so there is no separate flag to keep in sync
         """
-        if self.is_completed:
-            return 0
-        
-        # Track first CPU allocation (for response time)
-        if self.start_time is None:
-            self.start_time = None  # Will be set by scheduler
-        
-        # Execute for the given time or remaining time, whichever is smaller
-        executed = min(time_units, self.remaining_time)
-        self.remaining_time -= executed
-        
-        # Check if process completed
-        if self.remaining_time == 0:
-            self.is_completed = True
-        
-        return executed
-    
+        return self.remaining_time == 0
+
     def calculate_metrics(self):
         """
         Calculate all metrics after process completion
@@ -77,30 +66,78 @@ class Process:
         if self.completion_time is None:
             print(f"[ERROR] Cannot calculate metrics for {self.pid} - completion_time not set")
             return
-        
+
         # TAT = Completion Time - Arrival Time
         self.turnaround_time = self.completion_time - self.arrival_time
-        
+
         # WT = Turnaround Time - Burst Time
         self.waiting_time = self.turnaround_time - self.burst_time
-        
+
         # RT = First CPU Time - Arrival Time
         if self.start_time is not None:
             self.response_time = self.start_time - self.arrival_time
-        
-        print(f"[DEBUG] {self.pid} Metrics: CT={self.completion_time}, "
-              f"TAT={self.turnaround_time}, WT={self.waiting_time}, RT={self.response_time}")
-    
+
     def __repr__(self):
         """
         String representation of the process
         """
         return (f"Process({self.pid}, AT={self.arrival_time}, BT={self.burst_time}, "
                 f"Priority={self.priority}, Queue={self.queue})")
-    
+
     def __str__(self):
         """
         User-friendly string representation
         """
         status = "Completed" if self.is_completed else f"Running (Remaining: {self.remaining_time})"
-        return f"{self.pid} [{status}]"
\ No newline at end of file
+        return f"{self.pid} [{status}]"
+
+
+class ProcessTable:
+    """
+    Structure-of-arrays view over a list of Process objects
+    Holds one NumPy array per field, so aggregations that would
+    otherwise loop over objects (averages, queue counts, PID ordering)
+    become single vectorized calls. Requires NumPy
+    """
+
+    __slots__ = ('pid', 'arrival_time', 'burst_time', 'priority', 'queue',
+                 'completion_time', 'turnaround_time', 'waiting_time', 'response_time')
+
+    def __init__(self, processes):
+        if np is None:
+            raise RuntimeError("ProcessTable requires NumPy to be installed")
+
+        n = len(processes)
+        self.pid = np.array([p.pid for p in processes], dtype=object)
+        self.arrival_time = np.fromiter((p.arrival_time for p in processes),
+                                        dtype=np.int64, count=n)
+        self.burst_time = np.fromiter((p.burst_time for p in processes),
+                                      dtype=np.int64, count=n)
+        self.priority = np.fromiter((p.priority for p in processes),
+                                    dtype=np.int8, count=n)
+        self.queue = np.fromiter((p.queue for p in processes),
+                                 dtype=np.int8, count=n)
+        self.completion_time = np.fromiter((p.completion_time for p in processes),
+                                           dtype=np.int64, count=n)
+        self.turnaround_time = np.fromiter((p.turnaround_time for p in processes),
+                                           dtype=np.int64, count=n)
+        self.waiting_time = np.fromiter((p.waiting_time for p in processes),
+                                        dtype=np.int64, count=n)
+        self.response_time = np.fromiter((p.response_time for p in processes),
+                                         dtype=np.int64, count=n)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def sort_order(self):
+        """
+        Indices that order the table by PID (reusable across displays)
+        """
+        return np.argsort(self.pid)
+
+    def queue_counts(self):
+        """
+        Number of processes per queue as a {queue: count} dict
+        """
+        return {1: int(np.count_nonzero(self.queue == 1)),
+                2: int(np.count_nonzero(self.queue == 2))}
@@ -3,63 +3,150 @@ Utility Functions
 Helper functions for metrics calculation and output formatting
 """
 
-def calculate_metrics(processes):
+import sys
+from collections import Counter
+from operator import attrgetter
+
+from process import ProcessTable
+
+# C-implemented sort key shared by the display helpers; avoids a Python
+# lambda frame per comparison
+_BY_PID = attrgetter('pid')
+
+# Bound format method for results-table rows, parsed once instead of
+# re-evaluating an f-string template per row
+_RESULT_ROW = "{:<6} {:<6} {:<6} {:<10} {:<8} {:<6} {:<6} {:<6} {:<6}".format
+
+# Field order for the per-process metric entries. Process uses slots, so
+# a single attrgetter call fetches all nine fields in C instead of nine
+# separate attribute lookups per process
+_METRIC_KEYS = ('pid', 'arrival_time', 'burst_time', 'priority', 'queue',
+                'completion_time', 'turnaround_time', 'waiting_time', 'response_time')
+_GET_METRICS = attrgetter(*_METRIC_KEYS)
+
+# Bound format method for the Gantt chart's detailed execution log rows
+_GANTT_ROW = "{:<10} {:<12} {:<12} {:<10}\n".format
+
+# NumPy is optional: metric aggregation uses vectorized array math when
+# it is available and falls back to plain Python sums otherwise
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba is optional on top of NumPy: for very large batches the metric
+# sums run through a JIT-compiled kernel that LLVM can vectorize.
+# cache=True persists the compiled kernel so the JIT cost is paid once.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _sum4(ct, tat, wt, rt):
+        s0 = s1 = s2 = s3 = 0.0
+        for i in range(ct.shape[0]):
+            s0 += ct[i]
+            s1 += tat[i]
+            s2 += wt[i]
+            s3 += rt[i]
+        return s0, s1, s2, s3
+
+# Below this many processes the plain NumPy sum wins; the JIT kernel
+# only pays off (and amortizes its compile time) on large batches
+_NUMBA_THRESHOLD = 10_000
+
+def calculate_metrics(processes, verbose=False):
     """
     Calculate CT, TAT, WT, RT for all processes and compute averages
     
     Args:
         processes: List of completed Process objects with execution data
+        verbose: If True, print each process's metrics while aggregating.
+                 Off by default so the computation itself stays free of
+                 stdout I/O (warnings and errors always print)
         
     Returns:
         Dictionary with individual and average metrics
     """
-    print("\n" + "="*60)
-    print("CALCULATING METRICS FOR ALL PROCESSES")
-    print("="*60 + "\n")
+    if verbose:
+        print("\n" + "="*60)
+        print("CALCULATING METRICS FOR ALL PROCESSES")
+        print("="*60 + "\n")
     
     if not processes:
         print("[ERROR] No processes to calculate metrics for!")
         return None
     
-    # Lists to store individual metrics for average calculation
-    completion_times = []
-    turnaround_times = []
-    waiting_times = []
-    response_times = []
-    
-    # Calculate metrics for each process
-    for process in processes:
-        # Ensure metrics are calculated
-        if process.completion_time is None:
-            print(f"[WARNING] {process.pid} has no completion time!")
-            continue
-        
-        # Get individual metrics
-        ct = process.completion_time
-        tat = process.turnaround_time
-        wt = process.waiting_time
-        rt = process.response_time
+    num_processes = len(processes)
+    
+    # Filter out never-completed processes once up front with a single
+    # aggregate warning, so the aggregation loops below carry no
+    # per-iteration None check
+    completed = [p for p in processes if p.completion_time is not None]
+    if len(completed) != len(processes):
+        print(f"[WARNING] {len(processes) - len(completed)} processes missing completion time!")
+    
+    # Single pass: build the per-process metric entries and aggregate the
+    # averages in the same loop, so each attribute is read exactly once.
+    # The entry list is pre-sized so appends never trigger a resize
+    plist = [None] * len(completed)
+    
+    if np is not None:
+        # SoA path: gather the completed processes into a ProcessTable
+        # (one contiguous array per field) and aggregate over its columns
+        for i, process in enumerate(completed):
+            values = _GET_METRICS(process)
+            plist[i] = dict(zip(_METRIC_KEYS, values))
+            if verbose:
+                ct, tat, wt, rt = values[5:]
+                print(f"{process.pid}: CT={ct}, TAT={tat}, WT={wt}, RT={rt}")
         
-        # Add to lists for averaging
-        completion_times.append(ct)
-        turnaround_times.append(tat)
-        waiting_times.append(wt)
-        response_times.append(rt)
+        table = ProcessTable(completed)
+        queue_counts = table.queue_counts()
+        if njit is not None and len(completed) > _NUMBA_THRESHOLD:
+            sums = _sum4(table.completion_time, table.turnaround_time,
+                         table.waiting_time, table.response_time)
+        else:
+            sums = (table.completion_time.sum(), table.turnaround_time.sum(),
+                    table.waiting_time.sum(), table.response_time.sum())
+        inv_n = 1.0 / num_processes
+        avg_ct, avg_tat, avg_wt, avg_rt = (float(s) * inv_n for s in sums)
+    else:
+        # Pure-Python fallback: accumulate the four metric sums directly
+        ct_sum = tat_sum = wt_sum = rt_sum = 0
+        q1_count = 0
+        for i, process in enumerate(completed):
+            values = _GET_METRICS(process)
+            ct, tat, wt, rt = values[5:]
+            
+            plist[i] = dict(zip(_METRIC_KEYS, values))
+            
+            q1_count += (process.queue == 1)
+            ct_sum += ct
+            tat_sum += tat
+            wt_sum += wt
+            rt_sum += rt
+            
+            if verbose:
+                print(f"{process.pid}: CT={ct}, TAT={tat}, WT={wt}, RT={rt}")
         
-        print(f"{process.pid}: CT={ct}, TAT={tat}, WT={wt}, RT={rt}")
+        # One division, four multiplications
+        inv_n = 1.0 / num_processes
+        avg_ct = ct_sum * inv_n
+        avg_tat = tat_sum * inv_n
+        avg_wt = wt_sum * inv_n
+        avg_rt = rt_sum * inv_n
+        queue_counts = {1: q1_count, 2: len(completed) - q1_count}
     
-    # Calculate averages
-    num_processes = len(processes)
-    avg_ct = sum(completion_times) / num_processes if num_processes > 0 else 0
-    avg_tat = sum(turnaround_times) / num_processes if num_processes > 0 else 0
-    avg_wt = sum(waiting_times) / num_processes if num_processes > 0 else 0
-    avg_rt = sum(response_times) / num_processes if num_processes > 0 else 0
-    
-    print(f"\nAverages: CT={avg_ct:.2f}, TAT={avg_tat:.2f}, WT={avg_wt:.2f}, RT={avg_rt:.2f}")
+    if verbose:
+        print(f"\nAverages: CT={avg_ct:.2f}, TAT={avg_tat:.2f}, WT={avg_wt:.2f}, RT={avg_rt:.2f}")
     
     # Return structured metrics
     metrics = {
-        'processes': [],
+        'processes': plist,
+        'queue_counts': queue_counts,
         'averages': {
             'completion_time': avg_ct,
             'turnaround_time': avg_tat,
@@ -68,30 +155,18 @@ def calculate_metrics(processes):
         }
     }
     
-    # Add individual process metrics
-    for process in processes:
-        metrics['processes'].append({
-            'pid': process.pid,
-            'arrival_time': process.arrival_time,
-            'burst_time': process.burst_time,
-            'priority': process.priority,
-            'queue': process.queue,
-            'completion_time': process.completion_time,
-            'turnaround_time': process.turnaround_time,
-            'waiting_time': process.waiting_time,
-            'response_time': process.response_time
-        })
-    
     return metrics
 
 
-def display_results(processes, metrics):
+def display_results(processes, metrics, sorted_processes=None):
     """
     Display formatted results table and summary
     
     Args:
         processes: List of completed Process objects
         metrics: Dictionary with calculated metrics
+        sorted_processes: Optional pre-sorted (by PID) view of processes,
+                          so repeat callers don't pay for the sort twice
     """
     print("\n" + "="*80)
     print("FINAL RESULTS - MLQ SCHEDULING")
@@ -105,21 +180,24 @@ def display_results(processes, metrics):
     print(f"{'PID':<6} {'AT':<6} {'BT':<6} {'Priority':<10} {'Queue':<8} {'CT':<6} {'TAT':<6} {'WT':<6} {'RT':<6}")
     print("-" * 80)
     
-    # Sort processes by PID for display
-    sorted_processes = sorted(processes, key=lambda p: p.pid)
+    # Sort processes by PID for display (unless the caller already did)
+    if sorted_processes is None:
+        sorted_processes = sorted(processes, key=_BY_PID)
     
-    # Display each process
+    # Display each process: format through the cached row template and
+    # emit the whole table body with a single write
+    rows = []
     for process in sorted_processes:
-        queue_name = f"Q{process.queue}"
-        print(f"{process.pid:<6} "
-              f"{process.arrival_time:<6} "
-              f"{process.burst_time:<6} "
-              f"{process.priority:<10} "
-              f"{queue_name:<8} "
-              f"{process.completion_time:<6} "
-              f"{process.turnaround_time:<6} "
-              f"{process.waiting_time:<6} "
-              f"{process.response_time:<6}")
+        rows.append(_RESULT_ROW(process.pid,
+                                process.arrival_time,
+                                process.burst_time,
+                                process.priority,
+                                f"Q{process.queue}",
+                                process.completion_time,
+                                process.turnaround_time,
+                                process.waiting_time,
+                                process.response_time))
+    sys.stdout.write("\n".join(rows) + "\n")
     
     # Display averages
     print("-" * 80)
@@ -131,22 +209,60 @@ def display_results(processes, metrics):
           f"{avg['response_time']:<6.2f}")
     print("="*80)
     
-    # Display summary
+    # Display summary: queue counts come precomputed from
+    # calculate_metrics; only recount if handed a bare metrics dict
+    qcount = metrics.get('queue_counts')
+    if qcount is None:
+        qcount = Counter(p.queue for p in processes)
     print("\nSUMMARY:")
     print(f"  Total Processes: {len(processes)}")
-    print(f"  Queue 1 (System - Preemptive Priority): {len([p for p in processes if p.queue == 1])} processes")
-    print(f"  Queue 2 (User - FCFS): {len([p for p in processes if p.queue == 2])} processes")
+    print(f"  Queue 1 (System - Preemptive Priority): {qcount.get(1, 0)} processes")
+    print(f"  Queue 2 (User - FCFS): {qcount.get(2, 0)} processes")
     print(f"\n  Average Turnaround Time: {avg['turnaround_time']:.2f}")
     print(f"  Average Waiting Time: {avg['waiting_time']:.2f}")
     print(f"  Average Response Time: {avg['response_time']:.2f}")
 
 
-def print_gantt_chart(execution_log):
+def _merge_execution_log(execution_log):
+    """
+    Merge consecutive executions of the same process into single entries
+    Pure function of the log, so callers that render repeatedly can merge
+    once and pass the result to print_gantt_chart
+    
+    Args:
+        execution_log: List of (process_id, start_time, end_time) tuples
+    
+    Returns:
+        List of [process_id, start_time, end_time] entries
+    """
+    # Entries are small lists so the extend case mutates the end time in
+    # place instead of allocating a replacement tuple per merged step.
+    # Pre-sized to the unmerged length (the upper bound) and trimmed, so
+    # growth never reallocates
+    merged_log = [None] * len(execution_log)
+    filled = 0
+    cur = None
+    for pid, start, end in execution_log:
+        if cur is not None and cur[0] == pid and cur[2] == start:
+            # Extend the last entry
+            cur[2] = end
+        else:
+            # Add new entry
+            cur = [pid, start, end]
+            merged_log[filled] = cur
+            filled += 1
+    del merged_log[filled:]
+    return merged_log
+
+
+def print_gantt_chart(execution_log, merged=None):
     """
     Display Gantt chart representation from execution log
     
     Args:
         execution_log: List of tuples (process_id, start_time, end_time)
+        merged: Optional pre-merged log (from _merge_execution_log), so
+                repeated renders skip the merge pass
     """
     print("\n" + "="*80)
     print("GANTT CHART")
@@ -156,42 +272,33 @@ def print_gantt_chart(execution_log):
         print("[ERROR] No execution log available!")
         return
     
-    # Merge consecutive executions of same process
-    merged_log = []
-    for pid, start, end in execution_log:
-        if merged_log and merged_log[-1][0] == pid and merged_log[-1][2] == start:
-            # Extend the last entry
-            merged_log[-1] = (pid, merged_log[-1][1], end)
-        else:
-            # Add new entry
-            merged_log.append((pid, start, end))
+    merged_log = merged if merged is not None else _merge_execution_log(execution_log)
     
     # Print Gantt chart
     print("Process Execution Timeline:")
     print()
     
-    # Top border
-    chart_line = "|"
-    time_line = "0"
+    # Build both lines as fragment lists and emit them with one write,
+    # avoiding quadratic string concatenation and per-line print calls
+    chart_parts = ["|"]
+    time_parts = ["0"]
     
     for pid, start, end in merged_log:
         duration = end - start
         # Each time unit represented by 4 characters
-        chart_line += f" {pid:^{duration*4-2}} |"
-        time_line += " " * (duration*4-1) + str(end)
+        chart_parts.append(f" {pid:^{duration*4-2}} |")
+        time_parts.append(" " * (duration*4-1) + str(end))
     
-    print(chart_line)
-    print(time_line)
-    print()
+    sys.stdout.write("".join(chart_parts) + "\n" + "".join(time_parts) + "\n\n")
     
     # Detailed execution log
     print("Detailed Execution Log:")
     print(f"{'Process':<10} {'Start Time':<12} {'End Time':<12} {'Duration':<10}")
     print("-" * 50)
     
-    for pid, start, end in merged_log:
-        duration = end - start
-        print(f"{pid:<10} {start:<12} {end:<12} {duration:<10}")
+    # Stream the rows through the cached format in one writelines call
+    sys.stdout.writelines(_GANTT_ROW(pid, start, end, end - start)
+                          for pid, start, end in merged_log)
     
     print("="*80)
 
@@ -207,24 +314,26 @@ def display_queue_assignment(processes):
     print("QUEUE ASSIGNMENTS")
     print("="*60 + "\n")
     
-    queue1_processes = [p for p in processes if p.queue == 1]
-    queue2_processes = [p for p in processes if p.queue == 2]
+    # Bucket by queue number in one pass; a dict of lists generalizes
+    # naturally if more queue levels are ever added
+    buckets = {1: [], 2: []}
+    for p in processes:
+        buckets[p.queue].append(p)
+    queue1_processes = buckets[1]
+    queue2_processes = buckets[2]
     
+    # Preformat each queue's lines and emit them with one print per queue
     print("Queue 1 (System Processes - Preemptive Priority):")
     print("  Priority 1-2 → Preemptive Priority Scheduling")
-    if queue1_processes:
-        for p in sorted(queue1_processes, key=lambda x: x.pid):
-            print(f"    {p.pid}: Priority={p.priority}, AT={p.arrival_time}, BT={p.burst_time}")
-    else:
-        print("    (None)")
+    q1_lines = [f"    {p.pid}: Priority={p.priority}, AT={p.arrival_time}, BT={p.burst_time}"
+                for p in sorted(queue1_processes, key=_BY_PID)]
+    print("\n".join(q1_lines) if q1_lines else "    (None)")
     
     print("\nQueue 2 (User Processes - FCFS):")
     print("  Priority 3-5 → First-Come, First-Served")
-    if queue2_processes:
-        for p in sorted(queue2_processes, key=lambda x: x.pid):
-            print(f"    {p.pid}: Priority={p.priority}, AT={p.arrival_time}, BT={p.burst_time}")
-    else:
-        print("    (None)")
+    q2_lines = [f"    {p.pid}: Priority={p.priority}, AT={p.arrival_time}, BT={p.burst_time}"
+                for p in sorted(queue2_processes, key=_BY_PID)]
+    print("\n".join(q2_lines) if q2_lines else "    (None)")
     
     print("\nStatic Priority Rule:")
     print("  → Queue 1 ALWAYS executes before Queue 2")